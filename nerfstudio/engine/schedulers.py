@@ -16,9 +16,11 @@
 
 """Scheduler Classes"""
 
+import bisect
+import math
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Literal, Optional, Tuple, Type, List
+from typing import Any, Callable, Literal, Optional, Sequence, Tuple, Type
 
 import numpy as np
 from torch.optim import Optimizer, lr_scheduler
@@ -32,6 +34,56 @@ except ImportError:
 from nerfstudio.configs.base_config import InstantiateConfig
 
 
+def _cosine_decay_constants(warm_up_end: int, max_steps: int) -> Tuple[float, float, float]:
+    """Returns ``(inv_warmup, warmup_offset, inv_decay)`` for the branchless warmup + cosine decay factor
+
+        min(step * inv_warmup + warmup_offset, cosine_decay(max(0, (step - warm_up_end) * inv_decay)))
+
+    The warmup term is below 1 before ``warm_up_end`` where the clamped decay term is exactly 1, and at least 1
+    afterwards where the decay term is at most 1, so the ``min`` picks the same branch as an explicit compare.
+    Without warmup the offset pins the warmup term to 1.
+    """
+    inv_warmup = 1.0 / warm_up_end if warm_up_end > 0 else 0.0
+    warmup_offset = 0.0 if warm_up_end > 0 else 1.0
+    # cos is even, so the magnitude is enough to also cover max_steps < warm_up_end
+    inv_decay = 1.0 / abs(max_steps - warm_up_end) if max_steps != warm_up_end else 0.0
+    return inv_warmup, warmup_offset, inv_decay
+
+
+def _cosine_decay_factor(warm_up_end: int, learning_rate_alpha: float, max_steps: int) -> Callable[[int], float]:
+    """Returns the linear warmup + cosine decay learning factor as a function of the step."""
+    inv_warmup, warmup_offset, inv_decay = _cosine_decay_constants(warm_up_end, max_steps)
+    alpha = learning_rate_alpha
+    scale = 0.5 * (1 - alpha)
+
+    def factor(step):
+        return min(
+            step * inv_warmup + warmup_offset,
+            alpha + scale * (1.0 + math.cos(math.pi * max(0.0, (step - warm_up_end) * inv_decay))),
+        )
+
+    return factor
+
+
+def _cosine_decay_table(num_steps: int, warm_up_end: int, learning_rate_alpha: float, max_steps: int) -> np.ndarray:
+    """Tabulates the linear warmup + cosine decay learning factor for the first ``num_steps`` steps.
+
+    Args:
+        num_steps: Number of steps to tabulate.
+        warm_up_end: Iteration number where warmup ends.
+        learning_rate_alpha: Learning factor reached at ``max_steps``.
+        max_steps: The maximum number of steps.
+    Returns:
+        The learning factor for every step.
+    """
+    inv_warmup, warmup_offset, inv_decay = _cosine_decay_constants(warm_up_end, max_steps)
+    alpha = learning_rate_alpha
+    steps = np.arange(num_steps, dtype=np.float64)
+    progress = np.maximum(0.0, (steps - warm_up_end) * inv_decay)
+    decay = alpha + 0.5 * (1 - alpha) * (1.0 + np.cos(np.pi * progress))
+    return np.minimum(steps * inv_warmup + warmup_offset, decay)
+
+
 @dataclass
 class SchedulerConfig(InstantiateConfig):
     """Basic scheduler config"""
@@ -60,6 +112,19 @@ class Scheduler:
             The scheduler object.
         """
 
+    @abstractmethod
+    def tabulate(self, num_steps: int, lr_init: float) -> np.ndarray:
+        """Abstract method that returns the learning rate multiplier of the first ``num_steps`` steps, i.e. the
+        learning rates divided by ``lr_init``. Useful to query the schedule over many steps without stepping an
+        optimizer.
+
+        Args:
+            num_steps: Number of steps to tabulate.
+            lr_init: The initial learning rate.
+        Returns:
+            Array of shape ``(num_steps,)`` with the multiplier of every step.
+        """
+
 
 @dataclass
 class MultiStepSchedulerConfig(SchedulerConfig):
@@ -88,6 +153,11 @@ class MultiStepScheduler(Scheduler):
         )
         return scheduler
 
+    def tabulate(self, num_steps: int, lr_init: float) -> np.ndarray:
+        steps = np.arange(num_steps)
+        index = np.searchsorted(sorted(self.config.milestones), steps, side="right")
+        return self.config.gamma ** index.astype(np.float64)
+
 
 @dataclass
 class ExponentialDecaySchedulerConfig(SchedulerConfig):
@@ -114,29 +184,44 @@ class ExponentialDecayScheduler(Scheduler):
 
     config: ExponentialDecaySchedulerConfig
 
-    def get_scheduler(self, optimizer: Optimizer, lr_init: float) -> LRScheduler:
+    def tabulate(self, num_steps: int, lr_init: float) -> np.ndarray:
         if self.config.lr_final is None:
             lr_final = lr_init
         else:
             lr_final = self.config.lr_final
 
+        warmup_steps = self.config.warmup_steps
+        max_steps = self.config.max_steps
+        lr_pre_warmup = self.config.lr_pre_warmup
+        log_i = math.log(lr_init)
+        log_f = math.log(lr_final)
+        _delta = lr_init - lr_pre_warmup
+        inv_warmup = 1.0 / warmup_steps if warmup_steps > 0 else 0.0
+        inv_decay = 1.0 / (max_steps - warmup_steps) if max_steps > warmup_steps else 0.0
+
+        def ramp_cosine(steps):
+            return lr_pre_warmup + _delta * np.sin(0.5 * np.pi * np.clip(steps * inv_warmup, 0, 1))
+
+        def ramp_linear(steps):
+            return lr_pre_warmup + _delta * steps * inv_warmup
+
+        ramp = ramp_cosine if self.config.ramp == "cosine" else ramp_linear
+
+        steps = np.arange(num_steps, dtype=np.float64)
+        t = np.clip((steps - warmup_steps) * inv_decay, 0, 1)
+        decay = np.exp(log_i + t * (log_f - log_i))
+        # divided by lr_init because the multiplier is with the initial learning rate
+        return np.where(steps < warmup_steps, ramp(steps), decay) / lr_init
+
+    def get_scheduler(self, optimizer: Optimizer, lr_init: float) -> LRScheduler:
+        # Tabulate the schedule once; it is constant after max(warmup_steps, max_steps).
+        # Kept as a float64 array (8 bytes per step) rather than a list of boxed Python floats.
+        table = self.tabulate(max(self.config.warmup_steps, self.config.max_steps) + 1, lr_init)
+        n = len(table)
+        last = float(table[-1])
+
         def func(step):
-            if step < self.config.warmup_steps:
-                if self.config.ramp == "cosine":
-                    lr = self.config.lr_pre_warmup + (lr_init - self.config.lr_pre_warmup) * np.sin(
-                        0.5 * np.pi * np.clip(step / self.config.warmup_steps, 0, 1)
-                    )
-                else:
-                    lr = (
-                        self.config.lr_pre_warmup
-                        + (lr_init - self.config.lr_pre_warmup) * step / self.config.warmup_steps
-                    )
-            else:
-                t = np.clip(
-                    (step - self.config.warmup_steps) / (self.config.max_steps - self.config.warmup_steps), 0, 1
-                )
-                lr = np.exp(np.log(lr_init) * (1 - t) + np.log(lr_final) * t)
-            return lr / lr_init  # divided by lr_init because the multiplier is with the initial learning rate
+            return float(table[step]) if step < n else last
 
         scheduler = lr_scheduler.LambdaLR(optimizer, lr_lambda=func)
         return scheduler
@@ -161,15 +246,22 @@ class CosineDecayScheduler(Scheduler):
 
     config: CosineDecaySchedulerConfig
 
+    def tabulate(self, num_steps: int, lr_init: float) -> np.ndarray:
+        return _cosine_decay_table(
+            num_steps, self.config.warm_up_end, self.config.learning_rate_alpha, self.config.max_steps
+        )
+
     def get_scheduler(self, optimizer: Optimizer, lr_init: float) -> LRScheduler:
+        warm_up_end = self.config.warm_up_end
+        alpha = self.config.learning_rate_alpha
+        max_steps = self.config.max_steps
+
+        factor = _cosine_decay_factor(warm_up_end, alpha, max_steps)
+        table = self.tabulate(max(warm_up_end, max_steps) + 1, lr_init)
+        n = len(table)
+
         def func(step):
-            if step < self.config.warm_up_end:
-                learning_factor = step / self.config.warm_up_end
-            else:
-                alpha = self.config.learning_rate_alpha
-                progress = (step - self.config.warm_up_end) / (self.config.max_steps - self.config.warm_up_end)
-                learning_factor = (np.cos(np.pi * progress) + 1.0) * 0.5 * (1 - alpha) + alpha
-            return learning_factor
+            return float(table[step]) if step < n else factor(step)
 
         scheduler = lr_scheduler.LambdaLR(optimizer, lr_lambda=func)
         return scheduler
@@ -183,25 +275,39 @@ class MultiStepWarmupSchedulerConfig(SchedulerConfig):
     """target class to instantiate"""
     warm_up_end: int = 5000
     """Iteration number where warmp ends"""
-    milestones: List[int] = field(default_factory=lambda: [300000, 400000, 500000])
+    milestones: Sequence[int] = (300000, 400000, 500000)
     """The milestone steps at which to decay the learning rate."""
     gamma: float = 0.33
     """The learning rate decay factor."""
 
+    def __post_init__(self) -> None:
+        self.milestones = tuple(self.milestones)
+
 
 class MultiStepWarmupScheduler(Scheduler):
     """Starts with a flat lr schedule until it reaches N epochs then applies a given scheduler"""
 
     config: MultiStepWarmupSchedulerConfig
 
+    def tabulate(self, num_steps: int, lr_init: float) -> np.ndarray:
+        steps = np.arange(num_steps)
+        index = np.searchsorted(sorted(self.config.milestones), steps, side="left")
+        return np.where(
+            steps < self.config.warm_up_end,
+            steps / max(self.config.warm_up_end, 1),
+            self.config.gamma ** index.astype(np.float64),
+        )
+
     def get_scheduler(self, optimizer: Optimizer, lr_init: float) -> LRScheduler:
+        warm_up_end = self.config.warm_up_end
+        # Sorted here rather than in the config, since configs loaded from a saved config.yml skip __post_init__.
+        milestones = tuple(sorted(self.config.milestones))
+        factors = [self.config.gamma**i for i in range(len(milestones) + 1)]
+
         def func(step):
-            if step < self.config.warm_up_end:
-                learning_factor = step / self.config.warm_up_end
-            else:
-                index = np.searchsorted(self.config.milestones, step, side="left")
-                learning_factor = self.config.gamma**index
-            return learning_factor
+            if step < warm_up_end:
+                return step / warm_up_end
+            return factors[bisect.bisect_left(milestones, step)]
 
         scheduler = lr_scheduler.LambdaLR(optimizer, lr_lambda=func)
         return scheduler
@@ -211,11 +317,16 @@ class ExponentialSchedulerConfig(InstantiateConfig):
     """Basic scheduler config with self-defined exponential decay schedule"""
 
     _target: Type = field(default_factory=lambda: lr_scheduler.ExponentialLR)
+    """target class to instantiate"""
     decay_rate: float = 0.1
+    """Factor the learning rate is decayed by over max_steps."""
     max_steps: int = 1000000
+    """The maximum number of steps."""
 
     def setup(self, optimizer=None, lr_init=None, **kwargs) -> Any:
         """Returns the instantiated object using the config."""
+        # The per-step gamma is computed once here. ExponentialLR.step() already updates the lr recursively
+        # (lr *= gamma) rather than evaluating gamma**step, so no custom scheduler is needed to avoid pow.
         return self._target(
             optimizer,
             self.decay_rate ** (1.0 / self.max_steps),
@@ -244,13 +355,12 @@ class NeuSScheduler(lr_scheduler.LambdaLR):
     """Starts with a flat lr schedule until it reaches N epochs then applies a given scheduler"""
 
     def __init__(self, optimizer, warm_up_end, learning_rate_alpha, max_steps) -> None:
+        factor = _cosine_decay_factor(warm_up_end, learning_rate_alpha, max_steps)
+        # Kept in the closure rather than on self so it is not written into the state dict.
+        table = _cosine_decay_table(max(warm_up_end, max_steps) + 1, warm_up_end, learning_rate_alpha, max_steps)
+        n = len(table)
+
         def func(step):
-            if step < warm_up_end:
-                learning_factor = step / warm_up_end
-            else:
-                alpha = learning_rate_alpha
-                progress = (step - warm_up_end) / (max_steps - warm_up_end)
-                learning_factor = (np.cos(np.pi * progress) + 1.0) * 0.5 * (1 - alpha) + alpha
-            return learning_factor
+            return float(table[step]) if step < n else factor(step)
 
         super().__init__(optimizer, lr_lambda=func)
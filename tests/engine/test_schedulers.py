@@ -0,0 +1,107 @@
+"""
+Test learning rate schedulers
+"""
+
+import numpy as np
+import pytest
+import torch
+
+from nerfstudio.engine.schedulers import (
+    CosineDecayScheduler,
+    CosineDecaySchedulerConfig,
+    ExponentialDecaySchedulerConfig,
+    MultiStepSchedulerConfig,
+    MultiStepWarmupScheduler,
+    MultiStepWarmupSchedulerConfig,
+    NeuSSchedulerConfig,
+)
+
+LR_INIT = 1e-2
+
+
+def _optimizer():
+    return torch.optim.SGD([torch.nn.Parameter(torch.zeros(1))], lr=LR_INIT)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        ExponentialDecaySchedulerConfig(warmup_steps=0, max_steps=200, lr_final=1e-4),
+        ExponentialDecaySchedulerConfig(warmup_steps=50, max_steps=200, lr_final=1e-4, ramp="cosine"),
+        ExponentialDecaySchedulerConfig(warmup_steps=50, max_steps=200, ramp="linear"),
+        CosineDecaySchedulerConfig(warm_up_end=50, max_steps=200),
+        CosineDecaySchedulerConfig(warm_up_end=0, max_steps=200),
+        CosineDecaySchedulerConfig(warm_up_end=250, max_steps=200),
+        MultiStepWarmupSchedulerConfig(warm_up_end=50, milestones=[100, 150], gamma=0.1),
+        MultiStepWarmupSchedulerConfig(warm_up_end=0, milestones=[100, 150], gamma=0.1),
+    ],
+)
+def test_tabulate_matches_lambda(config):
+    """Test that tabulate agrees with the lr lambda, including past the end of the lookup table"""
+    scheduler = config.setup()
+    lr_lambda = scheduler.get_scheduler(_optimizer(), LR_INIT).lr_lambdas[0]
+    num_steps = 400
+    table = scheduler.tabulate(num_steps, LR_INIT)
+    assert table.shape == (num_steps,)
+    for step in range(num_steps):
+        assert lr_lambda(step) == pytest.approx(table[step], rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("warm_up_end", [0, 50, 250])
+def test_neus_scheduler_matches_cosine_decay(warm_up_end):
+    """Test that the NeuS scheduler follows the cosine decay schedule"""
+    neus = NeuSSchedulerConfig(warm_up_end=warm_up_end, max_steps=200).setup(optimizer=_optimizer())
+    table = CosineDecayScheduler(CosineDecaySchedulerConfig(warm_up_end=warm_up_end, max_steps=200)).tabulate(
+        400, LR_INIT
+    )
+    for step in range(400):
+        assert neus.lr_lambdas[0](step) == pytest.approx(table[step], rel=1e-9, abs=1e-12)
+
+
+def test_exponential_decay_endpoints():
+    """Test the exponential decay scheduler starts at lr_pre_warmup and ends at lr_final"""
+    config = ExponentialDecaySchedulerConfig(lr_pre_warmup=1e-8, warmup_steps=50, max_steps=200, lr_final=1e-4)
+    table = config.setup().tabulate(300, LR_INIT)
+    assert table[0] * LR_INIT == pytest.approx(1e-8)
+    assert table[50] == pytest.approx(1.0)
+    assert table[200] * LR_INIT == pytest.approx(1e-4)
+    assert table[299] * LR_INIT == pytest.approx(1e-4)
+
+
+def test_multi_step_tabulate_matches_multi_step_lr():
+    """Test that MultiStepScheduler.tabulate decays at the milestone like MultiStepLR"""
+    scheduler = MultiStepSchedulerConfig(milestones=(10, 20, 20), gamma=0.5).setup()
+    optimizer = _optimizer()
+    lr_scheduler = scheduler.get_scheduler(optimizer, LR_INIT)
+    table = scheduler.tabulate(30, LR_INIT)
+    for step in range(30):
+        assert optimizer.param_groups[0]["lr"] == pytest.approx(LR_INIT * table[step])
+        optimizer.step()
+        lr_scheduler.step()
+    assert table[9] == pytest.approx(1.0)
+    assert table[10] == pytest.approx(0.5)
+    assert table[20] == pytest.approx(0.125)
+
+
+def test_unsorted_milestones():
+    """Test that unsorted milestones give the same schedule as sorted ones, also for configs that skipped
+    __post_init__"""
+    assert MultiStepWarmupSchedulerConfig(milestones=[20, 10]).milestones == (20, 10)
+    assert np.array_equal(
+        MultiStepSchedulerConfig(milestones=(20, 10)).setup().tabulate(30, LR_INIT),
+        MultiStepSchedulerConfig(milestones=(10, 20)).setup().tabulate(30, LR_INIT),
+    )
+
+    expected = MultiStepWarmupScheduler(
+        MultiStepWarmupSchedulerConfig(warm_up_end=5, milestones=[10, 20], gamma=0.1)
+    ).get_scheduler(_optimizer(), LR_INIT)
+
+    # Configs loaded from a saved config.yml keep the milestones as written.
+    config = MultiStepWarmupSchedulerConfig(warm_up_end=5, gamma=0.1)
+    config.milestones = [20, 10]
+    scheduler = MultiStepWarmupScheduler(config)
+    lr_lambda = scheduler.get_scheduler(_optimizer(), LR_INIT).lr_lambdas[0]
+    table = scheduler.tabulate(30, LR_INIT)
+    for step in range(30):
+        assert lr_lambda(step) == pytest.approx(expected.lr_lambdas[0](step))
+        assert table[step] == pytest.approx(expected.lr_lambdas[0](step))